@@ -0,0 +1,117 @@
+"""On-disk replay cache for raw nba_api endpoint responses.
+
+Entries are gzip-compressed JSON, content-addressed by a hash of
+(endpoint, player_id, season, season_type). Entries written after their season
+ended never expire; anything fetched earlier (possibly partial) expires after
+`nba_api_cache_ttl` seconds. Age comes from the `fetched_at` stamp stored in
+each entry, not the file mtime, so copied cache dirs keep their expiry. In offline mode
+any cached entry is served regardless of age and a miss raises instead of
+touching the network.
+"""
+
+from __future__ import annotations
+import gzip
+import hashlib
+import json
+import os
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+from .config import settings
+from .util_logging import get_logger
+
+log = get_logger(__name__)
+
+
+class OfflineCacheMiss(LookupError):
+    """Raised in offline mode when a response is not in the cache."""
+
+
+def season_end(season: str) -> date:
+    """'2023-24' is complete once the following July starts (playoffs are over)."""
+    return date(int(season[:4]) + 1, 7, 1)
+
+
+def season_is_complete(season: str, today: date | None = None) -> bool:
+    return (today or date.today()) >= season_end(season)
+
+
+def cache_key(endpoint: str, player_id: int, season: str, season_type: str) -> str:
+    raw = json.dumps([endpoint, int(player_id), season, season_type], separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _path(key: str) -> Path:
+    return Path(settings.nba_api_cache_dir) / key[:2] / f"{key}.json.gz"
+
+
+def _fresh(entry: dict[str, Any], season: str) -> bool:
+    if settings.nba_api_offline:
+        return True
+    fetched_at = entry.get("fetched_at")
+    if not isinstance(fetched_at, (int, float)):
+        return False  # pre-stamp entry: age unknown
+    # Only a log fetched after the season ended is final; earlier ones may be partial
+    if date.fromtimestamp(fetched_at) >= season_end(season):
+        return True
+    return time.time() - fetched_at < settings.nba_api_cache_ttl
+
+
+def _read(path: Path) -> dict[str, Any]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as f:
+        json.dump(payload, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def get_or_fetch(
+    endpoint: str,
+    player_id: int,
+    season: str,
+    season_type: str,
+    fetch: Callable[[], dict[str, Any]],
+) -> tuple[dict[str, Any], bool]:
+    """Return (raw_response, from_cache); `fetch` is only called on a miss or stale entry."""
+    if not settings.nba_api_cache_dir:
+        if settings.nba_api_offline:
+            raise OfflineCacheMiss("offline mode requires NBA_API_CACHE_DIR")
+        return fetch(), False
+
+    path = _path(cache_key(endpoint, player_id, season, season_type))
+    if path.exists():
+        try:
+            entry = _read(path)
+            if _fresh(entry, season):
+                return entry["response"], True
+        except (OSError, EOFError, ValueError, KeyError) as e:
+            log.warning(f"discarding unreadable cache entry {path.name}: {e}")
+    if settings.nba_api_offline:
+        raise OfflineCacheMiss(f"{endpoint} player={player_id} season={season} ({season_type}) not cached")
+
+    raw = fetch()
+    _write(path, {
+        "key": {"endpoint": endpoint, "player_id": int(player_id), "season": season, "season_type": season_type},
+        "fetched_at": time.time(),
+        "response": raw,
+    })
+    return raw, False
+
+
+def first_frame(raw: dict[str, Any]) -> pd.DataFrame:
+    """First result set of a raw stats.nba.com response as a DataFrame (like get_data_frames()[0])."""
+    sets = raw.get("resultSets") or raw.get("resultSet") or []
+    if isinstance(sets, dict):
+        sets = [sets]
+    if not sets:
+        return pd.DataFrame()
+    return pd.DataFrame(sets[0].get("rowSet", []), columns=sets[0].get("headers", []))
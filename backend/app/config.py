@@ -11,10 +11,18 @@ class Settings(BaseModel):
     nba_api_timeout: int = int(os.getenv("NBA_API_TIMEOUT", "20"))
     nba_api_retries: int = int(os.getenv("NBA_API_RETRIES", "3"))
     proxy: str | None = os.getenv("PROXY") or None
+
+    # Replay cache for raw nba_api responses ("" disables)
+    nba_api_cache_dir: str = os.getenv("NBA_API_CACHE_DIR", "./nba_api_cache")
+    nba_api_cache_ttl: int = int(os.getenv("NBA_API_CACHE_TTL", "21600"))  # seconds, current season only
+    nba_api_offline: bool = _parse_bool(os.getenv("NBA_API_OFFLINE"), False)
     allow_origins: str = os.getenv("ALLOW_ORIGINS", "http://localhost:5173")
 
     # On-demand mode
     on_demand_fetch: bool = _parse_bool(os.getenv("ON_DEMAND_FETCH"), True)
     on_demand_seasons: list[str] = [s.strip() for s in os.getenv("ON_DEMAND_SEASONS", "2024-25,2023-24").split(",") if s.strip()]
 
+    # Shared memory-mapped player_games snapshot ("" disables)
+    snapshot_dir: str = os.getenv("SNAPSHOT_DIR", "./snapshot")
+
 settings = Settings()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import numpy as np
 import pandas as pd
-from scipy.stats import norm, kendalltau
+from scipy.stats import norm, kendalltau, qmc, t as student_t
 
 # Gaussian copula utilities
 
@@ -15,12 +15,117 @@ def ecdf_inverse_quantile(x: np.ndarray, u: np.ndarray) -> np.ndarray:
     return np.interp(u, ranks, xs)
 
 
-def gaussian_copula_joint_overprob(df: pd.DataFrame, legs: list[dict], n_samples: int = 20000) -> tuple[float, list[float], list[list[float]]]:
-    """Compute joint probability that each prop exceeds its threshold using a Gaussian copula.
-    - df: DataFrame with columns for each prop used in legs (aligned by game_id).
-    - legs: [{player_id, prop, threshold, op}] with op assumed '>=/over'.
-    Returns: (joint_prob, marginals, kendall_tau_matrix)
+SAMPLERS = ("mc", "antithetic", "sobol")
+
+# Sobol draws are organised as independent scrambles so a standard error can be
+# read off the spread of replicate means (randomised QMC). With this few replicates
+# the spread is itself noisy, so the error is inflated to a t(R-1) interval width.
+_SOBOL_REPLICATES = 16
+_SOBOL_SE_INFLATE = float(student_t.ppf(0.975, _SOBOL_REPLICATES - 1) / norm.ppf(0.975))
+_MIN_BATCH = 1024
+
+
+def _mvn_hits(Z: np.ndarray, L: np.ndarray, X: np.ndarray, thresholds: list[float]) -> np.ndarray:
+    """Map iid normals through MVN(0, R) and the empirical marginals; True where every leg hits."""
+    Us = norm.cdf(Z @ L.T)
+    meets = np.ones(Z.shape[0], dtype=bool)
+    for j, th in enumerate(thresholds):
+        meets &= (ecdf_inverse_quantile(X[:, j], Us[:, j]) >= th)
+    return meets
+
+
+def _simulate_joint(
+    L: np.ndarray,
+    X: np.ndarray,
+    thresholds: list[float],
+    n_samples: int,
+    sampler: str,
+    seed: int | None,
+    tol: float | None,
+) -> tuple[float, float, int]:
+    """Estimate Pr[all legs hit] by simulation.
+    Without tol about n_samples draws are used; with tol, draws grow in batches
+    until the standard error is <= tol or n_samples is exhausted.
+    Returns: (joint_prob, std_error, n_draws)
+    """
+    d = L.shape[0]
+    ss = np.random.SeedSequence(seed)
+    first = n_samples if tol is None else min(n_samples, _MIN_BATCH)
+
+    if sampler == "sobol":
+        engines = [qmc.Sobol(d, scramble=True, seed=np.random.default_rng(c))
+                   for c in ss.spawn(_SOBOL_REPLICATES)]
+        # Per-replicate sizes stay powers of two to keep Sobol balance properties,
+        # and never exceed the n_samples budget across replicates
+        per = 1 << max(int(np.round(np.log2(first / _SOBOL_REPLICATES))), 0)
+        while per > 1 and per * _SOBOL_REPLICATES > n_samples:
+            per //= 2
+        hits = np.zeros(_SOBOL_REPLICATES)
+        counts = np.zeros(_SOBOL_REPLICATES)
+        step = per
+        prev_se = 0.0
+        while True:
+            for r, eng in enumerate(engines):
+                U = np.clip(eng.random(step), 1e-12, 1.0 - 1e-12)
+                hits[r] += _mvn_hits(norm.ppf(U), L, X, thresholds).sum()
+                counts[r] += step
+            means = hits / counts
+            raw_se = float(_SOBOL_SE_INFLATE * means.std(ddof=1) / np.sqrt(_SOBOL_REPLICATES))
+            # Stopping on a lucky low spread understates the error; never report less than
+            # the previous level's error scaled for the doubled sample (the MC rate)
+            se = max(raw_se, prev_se / np.sqrt(2.0))
+            prev_se = raw_se
+            n = int(counts.sum())
+            if tol is None or se <= tol or 2 * n > n_samples:
+                return float(means.mean()), se, n
+            step = int(counts[0])  # double each replicate
+
+    rng = np.random.default_rng(ss)
+    vals = np.empty(0)
+    step = first
+    while True:
+        if sampler == "antithetic":
+            Z = rng.standard_normal(size=(max(step // 2, 1), d))
+            a = _mvn_hits(Z, L, X, thresholds)
+            b = _mvn_hits(-Z, L, X, thresholds)
+            batch = (a.astype(float) + b) / 2.0
+            per_val = 2
+        else:
+            batch = _mvn_hits(rng.standard_normal(size=(step, d)), L, X, thresholds).astype(float)
+            per_val = 1
+        vals = np.concatenate([vals, batch])
+        se = float(vals.std(ddof=1) / np.sqrt(len(vals))) if len(vals) > 1 else 0.0
+        n = len(vals) * per_val
+        if tol is None or se <= tol or n >= n_samples:
+            return float(vals.mean()), se, n
+        step = min(n, n_samples - n)
+
+
+def check_sampler(sampler: str, n_samples: int) -> None:
+    """Raise ValueError if the sampler is unknown or cannot work within n_samples draws."""
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unsupported sampler: {sampler}")
+    min_samples = {"mc": 1, "antithetic": 2, "sobol": _SOBOL_REPLICATES}[sampler]
+    if n_samples < min_samples:
+        raise ValueError(f"n_samples must be >= {min_samples} for sampler '{sampler}'")
+
+
+def gaussian_copula_joint_estimate(
+    df: pd.DataFrame,
+    legs: list[dict],
+    n_samples: int = 20000,
+    *,
+    sampler: str = "mc",
+    seed: int | None = None,
+    tol: float | None = None,
+) -> tuple[float, list[float], list[list[float]], float | None, int]:
+    """Gaussian copula joint over-probability with simulation diagnostics.
+    - sampler: 'mc' (pseudo-random), 'antithetic' (Z/-Z pairs) or 'sobol' (scrambled QMC).
+    - seed: makes the estimate reproducible; None draws fresh entropy.
+    - tol: target standard error for adaptive stopping; n_samples is then the draw budget.
+    Returns: (joint_prob, marginals, kendall_tau_matrix, std_error, n_draws)
     """
+    check_sampler(sampler, n_samples)
     props = [leg["prop"] for leg in legs]
     X = df[props].astype(float).to_numpy()
     if X.size == 0 or X.shape[0] < 5:
@@ -31,7 +136,7 @@ def gaussian_copula_joint_overprob(df: pd.DataFrame, legs: list[dict], n_samples
             marginals.append(float((xi >= float(leg["threshold"])) .mean()) if len(xi) else 0.0)
         joint_indep = float(np.prod(marginals))
         taus = [[1.0 if i==j else 0.0 for j in range(len(legs))] for i in range(len(legs))]
-        return joint_indep, marginals, taus
+        return joint_indep, marginals, taus, None, 0
 
     # Transform to Gaussian space via probability integral transform
     Ucols = []
@@ -57,21 +162,21 @@ def gaussian_copula_joint_overprob(df: pd.DataFrame, legs: list[dict], n_samples
             tau, _ = kendalltau(df[props[i]], df[props[j]])
             taus[i][j] = taus[j][i] = float(0.0 if tau is None or np.isnan(tau) else tau)
 
-    # Monte Carlo sampling from MVN(0, R)
+    # Empirical marginals; thresholds over/>= assumed
+    thresholds = [float(leg["threshold"]) for leg in legs]
+    marginals = [float((X[:, j] >= th).mean()) for j, th in enumerate(thresholds)]
+
+    # Simulate from MVN(0, R), map to empirical quantiles, then check thresholds
     L = np.linalg.cholesky(R)
-    Zs = np.random.normal(size=(n_samples, len(props))) @ L.T
-    Us = norm.cdf(Zs)
+    joint, se, n = _simulate_joint(L, X, thresholds, n_samples, sampler, seed, tol)
+    return joint, marginals, taus, se, n
 
-    # Map uniform to empirical quantiles, then check thresholds
-    meets = np.ones(n_samples, dtype=bool)
-    marginals = []
-    for j, leg in enumerate(legs):
-        x = X[:, j]
-        q = ecdf_inverse_quantile(x, Us[:, j])
-        th = float(leg["threshold"])  # over/>= assumed
-        mj = float((x >= th).mean())
-        marginals.append(mj)
-        meets &= (q >= th)
-
-    joint = float(meets.mean())
-    return joint, marginals, taus
\ No newline at end of file
+
+def gaussian_copula_joint_overprob(df: pd.DataFrame, legs: list[dict], n_samples: int = 20000) -> tuple[float, list[float], list[list[float]]]:
+    """Compute joint probability that each prop exceeds its threshold using a Gaussian copula.
+    - df: DataFrame with columns for each prop used in legs (aligned by game_id).
+    - legs: [{player_id, prop, threshold, op}] with op assumed '>=/over'.
+    Returns: (joint_prob, marginals, kendall_tau_matrix)
+    """
+    joint, marginals, taus, _, _ = gaussian_copula_joint_estimate(df, legs, n_samples)
+    return joint, marginals, taus
@@ -11,6 +11,7 @@ from nba_api.stats.static import players
 from nba_api.stats.endpoints import PlayerGameLog
 from sqlalchemy import select
 
+from . import api_cache
 from .db import session_scope
 from .models import Player, PlayerGame, Game
 from .util_logging import get_logger
@@ -27,9 +28,19 @@ def _to_date(v) -> date:
     raise ValueError("Invalid date")
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
-def fetch_player_games(player_id: int, season: str) -> pd.DataFrame:
-    gl = PlayerGameLog(player_id=player_id, season=season, season_type_all_star="Regular Season")
-    return gl.get_data_frames()[0]
+def _download_player_games(player_id: int, season: str, season_type: str) -> dict:
+    gl = PlayerGameLog(player_id=player_id, season=season, season_type_all_star=season_type)
+    return gl.get_dict()
+
+def _fetch_player_games(player_id: int, season: str, season_type: str) -> tuple[pd.DataFrame, bool]:
+    raw, cached = api_cache.get_or_fetch(
+        "PlayerGameLog", player_id, season, season_type,
+        lambda: _download_player_games(player_id, season, season_type),
+    )
+    return api_cache.first_frame(raw), cached
+
+def fetch_player_games(player_id: int, season: str, season_type: str = "Regular Season") -> pd.DataFrame:
+    return _fetch_player_games(player_id, season, season_type)[0]
 
 def upsert_players() -> int:
     log.info("Fetching players list...")
@@ -65,12 +76,14 @@ def ingest_season(
     total_rows = 0
     for pid in pids:
         try:
-            df = fetch_player_games(pid, season)
+            df, cached = _fetch_player_games(pid, season, "Regular Season")
         except Exception as e:
             log.warning(f"player {pid} failed: {e}")
             continue
+        # Only throttle when we actually hit the API
+        pause = 0.0 if cached else sleep
         if df.empty:
-            time.sleep(sleep); continue
+            time.sleep(pause); continue
 
         df.rename(columns=str.lower, inplace=True)
         df["game_date"] = pd.to_datetime(df["game_date"]).dt.date
@@ -81,7 +94,7 @@ def ingest_season(
             if end_date:   mask &= (df["game_date"] <= end_date)
             df = df[mask]
             if df.empty:
-                time.sleep(sleep); continue
+                time.sleep(pause); continue
 
         with session_scope() as s:
             for _, r in df.iterrows():
@@ -117,7 +130,7 @@ def ingest_season(
                     fta=float(r.get("fta", 0) or 0),
                 ))
         total_rows += len(df)
-        time.sleep(sleep)  # be nice to the API
+        time.sleep(pause)  # be nice to the API
 
     log.info(f"Ingested ~{total_rows} rows for season {season} (range {start_date}..{end_date}).")
     return total_rows
@@ -1,9 +1,11 @@
 # backend/app/main.py
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .db import engine, Base
 from .config import settings
 from .util_logging import get_logger
+from . import models  # noqa: F401  (registers tables on Base.metadata)
 from . import router_players, router_props, router_chat, router_admin  # <-- include admin
 
 log = get_logger(__name__)
@@ -18,10 +20,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+_warmed = False
+
+def warm_up():
+    """Create tables, import the heavy modules and load hot data (player index, snapshot).
+    Runs once: in the gunicorn master when preload_app is on (workers fork warm),
+    otherwise in each worker's startup before it accepts traffic.
+    """
+    global _warmed
+    if _warmed:
+        return
+    t0 = time.perf_counter()
+    Base.metadata.create_all(bind=engine)
+    from . import copula, nlp, props, ingest  # noqa: F401  (scipy.stats, rapidfuzz, pandas, nba_api)
+    from .players import load_players_cache
+    from .snapshot import get_snapshot
+    load_players_cache()
+    get_snapshot()
+    _warmed = True
+    log.info(f"Warm-up done in {time.perf_counter() - t0:.2f}s. CORS allow_origins={origins}")
+
 @app.on_event("startup")
 def startup():
-    Base.metadata.create_all(bind=engine)
-    log.info(f"DB tables ensured. CORS allow_origins={origins}")
+    warm_up()
 
 # Routers
 app.include_router(router_players.router)
@@ -6,6 +6,7 @@ from sqlalchemy import select
 from datetime import date
 from .db import session_scope
 from .models import PlayerGame
+from .snapshot import get_snapshot
 
 SUPPORTED_PROPS = ["pts", "reb", "ast", "stl", "blk", "tov", "fg3m"]
 
@@ -14,6 +15,10 @@ def _empty_hist() -> pd.DataFrame:
     return pd.DataFrame(columns=["pts","reb","ast","stl","blk","tov","fg3m","minutes","game_id"])
 
 def _get_player_history(player_id: int, cutoff: date | None = None) -> pd.DataFrame:
+    snap = get_snapshot()
+    if snap is not None:
+        df = snap.player_frame(player_id)
+        return df if not df.empty else _empty_hist()
     with session_scope() as s:
         stmt = select(PlayerGame).where(PlayerGame.player_id == player_id)
         rows = s.execute(stmt).scalars().all()
@@ -54,18 +59,24 @@ def marginal_over_probability(player_id: int, prop: str, threshold: float, cutof
 
 def build_joint_dataset(legs: list[dict], cutoff: date | None = None) -> pd.DataFrame:
     frames = []
-    with session_scope() as s:
+    snap = get_snapshot()
+    if snap is not None:
         for leg in legs:
-            rows = s.execute(
-                select(PlayerGame).where(PlayerGame.player_id == leg["player_id"])
-            ).scalars().all()
-            if not rows:
-                # still create an empty frame with expected columns so merges work
-                frames.append(pd.DataFrame(columns=["game_id", leg["prop"]]))
-                continue
-            f = pd.DataFrame([{ "game_id": r.game_id, leg["prop"]: getattr(r, leg["prop"]) } for r in rows])
-            f = f.dropna()
-            frames.append(f)
+            f = snap.player_frame(leg["player_id"], [leg["prop"]])[["game_id", leg["prop"]]]
+            frames.append(f.dropna())
+    else:
+        with session_scope() as s:
+            for leg in legs:
+                rows = s.execute(
+                    select(PlayerGame).where(PlayerGame.player_id == leg["player_id"])
+                ).scalars().all()
+                if not rows:
+                    # still create an empty frame with expected columns so merges work
+                    frames.append(pd.DataFrame(columns=["game_id", leg["prop"]]))
+                    continue
+                f = pd.DataFrame([{ "game_id": r.game_id, leg["prop"]: getattr(r, leg["prop"]) } for r in rows])
+                f = f.dropna()
+                frames.append(f)
 
     if not frames:
         return pd.DataFrame()
@@ -0,0 +1,61 @@
+"""orjson-backed response classes: a JSON response and a streaming NDJSON response."""
+
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Iterator
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+from .util_logging import get_logger
+
+log = get_logger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    # Handlers hand back pydantic models (e.g. parsed PropLegs) and numpy scalars
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (numpy arrays and pydantic models allowed)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class NDJSONResponse(StreamingResponse):
+    """Stream one JSON document per line as `rows` yields them.
+    `rows` is consumed lazily (sync iterators run in the threadpool), so the
+    first line is sent as soon as the first result is ready.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    def __init__(self, rows: Iterable[Any], **kwargs: Any):
+        super().__init__((dumps(row) + b"\n" for row in rows), media_type=NDJSON_MEDIA_TYPE, **kwargs)
+
+
+def validated_rows(
+    model: type[BaseModel], items: Iterable[Any], compute: Callable[[int, Any], dict]
+) -> Iterator[dict]:
+    """Yield compute(i, item) for each item, shaped by `model` like a response_model would.
+    A failing item becomes an {"index": i, "error": ...} line instead of cutting the stream.
+    """
+    for i, item in enumerate(items):
+        try:
+            yield model.model_validate(compute(i, item)).model_dump(mode="json")
+        except Exception as e:
+            log.warning(f"stream item {i} failed: {e!r}")
+            yield {"index": i, "error": str(getattr(e, "detail", None) or e)}
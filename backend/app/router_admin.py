@@ -1,18 +1,18 @@
 # backend/app/router_admin.py
 from __future__ import annotations
 from fastapi import APIRouter, BackgroundTasks, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from uuid import uuid4
 import threading
 import numpy as np
-import pandas as pd
 from datetime import date, timedelta
 
 from .db import session_scope
 from .models import Player, Game, PlayerGame
 from .util_logging import get_logger
-from .ingest import upsert_players, ingest_season
+
+# ingest (nba_api, pandas) and snapshot are imported where used to keep app import cheap
 
 log = get_logger(__name__)
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -34,6 +34,8 @@ def start_ingest(payload: IngestPayload, bg: BackgroundTasks):
         TASKS[task_id] = {"id": task_id, "status": "queued", "note": None}
 
     def worker():
+        from .ingest import upsert_players, ingest_season
+        from .snapshot import publish_snapshot
         try:
             with LOCK:
                 TASKS[task_id]["status"] = "running"
@@ -42,6 +44,7 @@ def start_ingest(payload: IngestPayload, bg: BackgroundTasks):
                 for season in payload.seasons:
                     log.info(f"[{task_id}] ingest_season({season})")
                     ingest_season(season, sleep=payload.sleep)
+                publish_snapshot()
             with LOCK:
                 TASKS[task_id]["status"] = "done"
         except Exception as e:
@@ -53,6 +56,42 @@ def start_ingest(payload: IngestPayload, bg: BackgroundTasks):
     bg.add_task(worker)
     return {"task_id": task_id, "status": "queued"}
 
+class SeedBulkPayload(BaseModel):
+    players: int = Field(500, gt=0, le=20000)
+    seasons: int = Field(5, gt=0, le=30)
+    games_per_season: int = Field(82, gt=0, le=100)
+    seed: int = 7
+
+@router.post("/seed_bulk")
+def start_seed_bulk(payload: SeedBulkPayload, bg: BackgroundTasks):
+    """Replace synthetic data with players x seasons of generated games (see app.synth)."""
+    task_id = uuid4().hex[:10]
+    with LOCK:
+        TASKS[task_id] = {"id": task_id, "status": "queued", "note": None}
+
+    def worker():
+        from .synth import seed_synthetic
+        from .snapshot import publish_snapshot
+        try:
+            with LOCK:
+                TASKS[task_id]["status"] = "running"
+            result = seed_synthetic(
+                payload.players, payload.seasons,
+                games_per_season=payload.games_per_season, seed=payload.seed,
+            )
+            publish_snapshot()
+            with LOCK:
+                TASKS[task_id]["status"] = "done"
+                TASKS[task_id]["result"] = result
+        except Exception as e:
+            log.exception("seed_bulk worker failed")
+            with LOCK:
+                TASKS[task_id]["status"] = "error"
+                TASKS[task_id]["note"] = str(e)
+
+    bg.add_task(worker)
+    return {"task_id": task_id, "status": "queued"}
+
 @router.get("/tasks/{task_id}")
 def get_task(task_id: str):
     t = TASKS.get(task_id)
@@ -77,6 +116,7 @@ def player_games_count(player_id: int):
 @router.post("/seed_demo")
 def seed_demo(player_id: int, games: int = 200):
     """Create synthetic PlayerGame rows for a player so the UI can be demoed immediately."""
+    from .snapshot import publish_snapshot
     rng = np.random.default_rng(7)
     with session_scope() as s:
         # Ensure player exists
@@ -105,4 +145,14 @@ def seed_demo(player_id: int, games: int = 200):
                     pts=pts, reb=reb, ast=ast, stl=stl, blk=blk, tov=tov,
                     fgm=pts/2.0, fga=18.0, fg3m=fg3m, fg3a=11.0, ftm=4.0, fta=4.5
                 ))
+    publish_snapshot()
     return {"inserted": games, "player_id": player_id}
+
+@router.post("/snapshot")
+def publish_history_snapshot():
+    """Re-publish the shared player_games snapshot from the current DB contents."""
+    from .snapshot import publish_snapshot
+    path = publish_snapshot()
+    if path is None:
+        raise HTTPException(status_code=400, detail="snapshots disabled (SNAPSHOT_DIR is empty)")
+    return {"snapshot": path.name}
@@ -1,13 +1,15 @@
+from typing import List, Union
 from fastapi import APIRouter
-from .schemas import ChatRequest, ChatResponse
-from .nlp import parse_query
+from .responses import ORJSONResponse, NDJSONResponse, validated_rows
+from .schemas import ChatRequest, ChatResponse, ChatBatchRequest, ChatBatchItem, BatchItemError
 from .router_props import sgp_probability, prop_probability
 from .schemas import PropProbabilityRequest, SGPRequest
 
-router = APIRouter(prefix="/chat", tags=["chat"])
+router = APIRouter(prefix="/chat", tags=["chat"], default_response_class=ORJSONResponse)
 
 @router.post("/ask", response_model=ChatResponse)
 def ask(req: ChatRequest):
+    from .nlp import parse_query  # pulls in players (rapidfuzz); preloaded by main.warm_up()
     legs, rationale = parse_query(req.query)
     if not legs:
         return {"answer": "Sorry, I couldn't parse any player props from that.", "legs": []}
@@ -19,4 +21,12 @@ def ask(req: ChatRequest):
     else:
         s = sgp_probability(SGPRequest(legs=legs))
         ans = f"Joint Pr ≈ {s['joint_probability']:.3f} across {len(legs)} legs."
-        return {"answer": ans + " " + rationale, "legs": legs, "probabilities": s}
\ No newline at end of file
+        return {"answer": ans + " " + rationale, "legs": legs, "probabilities": s}
+
+@router.post("/ask/batch", response_model=List[Union[ChatBatchItem, BatchItemError]])
+def ask_batch(req: ChatBatchRequest, stream: bool = False):
+    """Answer many queries; with stream=true each answer is sent as NDJSON as soon as it is ready."""
+    def row(i, q):
+        return {"index": i, "query": q, **ask(ChatRequest(query=q))}
+    rows = validated_rows(ChatBatchItem, req.queries, row)
+    return NDJSONResponse(rows) if stream else list(rows)
@@ -1,17 +1,30 @@
+from typing import List, Union
 from fastapi import APIRouter, HTTPException
-from .schemas import PropProbabilityRequest, PropProbabilityResponse, SGPRequest, SGPResponse
-from .props import marginal_over_probability, build_joint_dataset
-from .copula import gaussian_copula_joint_overprob
+from .responses import ORJSONResponse, NDJSONResponse, validated_rows
+from .schemas import (
+    PropProbabilityRequest, PropProbabilityResponse, SGPRequest, SGPResponse,
+    PropBatchRequest, PropBatchItem, SGPBatchRequest, SGPBatchItem, BatchItemError,
+)
 
-router = APIRouter(prefix="/props", tags=["props"])
+# props/copula (pandas, scipy.stats) are imported inside handlers so that importing
+# the app stays cheap; main.warm_up() loads them before traffic is accepted.
+
+router = APIRouter(prefix="/props", tags=["props"], default_response_class=ORJSONResponse)
 
 @router.post("/probability", response_model=PropProbabilityResponse)
 def prop_probability(req: PropProbabilityRequest):
+    from .props import marginal_over_probability
     p, n, details = marginal_over_probability(req.leg.player_id, req.leg.prop, req.leg.threshold, req.leg.date)
     return {"probability": p, "sample_size": n, "details": details}
 
 @router.post("/sgp", response_model=SGPResponse)
 def sgp_probability(req: SGPRequest):
+    from .props import marginal_over_probability, build_joint_dataset
+    from .copula import gaussian_copula_joint_estimate, check_sampler
+    try:
+        check_sampler(req.sampler, req.n_samples)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     legs = [l.model_dump() for l in req.legs]
     df = build_joint_dataset(legs, cutoff=None)
     if df.empty:
@@ -29,10 +42,30 @@ def sgp_probability(req: SGPRequest):
             "kendall_tau": [[1.0 if i==j else 0.0 for j in range(len(req.legs))] for i in range(len(req.legs))],
             "sample_size": 0,
         }
-    joint, marginals, taus = gaussian_copula_joint_overprob(df, legs, n_samples=req.n_samples)
+    joint, marginals, taus, se, n_draws = gaussian_copula_joint_estimate(
+        df, legs, n_samples=req.n_samples, sampler=req.sampler, seed=req.seed, tol=req.tol
+    )
     return {
         "joint_probability": joint,
         "per_leg": [{"marginal": m, "threshold": leg.threshold} for m, leg in zip(marginals, req.legs)],
         "kendall_tau": taus,
         "sample_size": int(len(df)),
-    }
\ No newline at end of file
+        "std_error": se,
+        "n_draws": n_draws,
+    }
+
+@router.post("/probability/batch", response_model=List[Union[PropBatchItem, BatchItemError]])
+def prop_probability_batch(req: PropBatchRequest, stream: bool = False):
+    """Marginals for many legs; with stream=true results are sent as NDJSON as each leg finishes."""
+    def row(i, leg):
+        return {"index": i, "leg": leg, **prop_probability(PropProbabilityRequest(leg=leg))}
+    rows = validated_rows(PropBatchItem, req.legs, row)
+    return NDJSONResponse(rows) if stream else list(rows)
+
+@router.post("/sgp/batch", response_model=List[Union[SGPBatchItem, BatchItemError]])
+def sgp_probability_batch(req: SGPBatchRequest, stream: bool = False):
+    """Joint probabilities for many parlays; with stream=true each parlay is sent as it finishes."""
+    def row(i, parlay):
+        return {"index": i, **sgp_probability(parlay)}
+    rows = validated_rows(SGPBatchItem, req.parlays, row)
+    return NDJSONResponse(rows) if stream else list(rows)
@@ -4,6 +4,7 @@ from datetime import date
 
 PropName = Literal["pts", "reb", "ast", "stl", "blk", "tov", "fg3m"]
 OpName = Literal[">=", ">", "over"]
+SamplerName = Literal["mc", "antithetic", "sobol"]
 
 class PlayerOut(BaseModel):
     id: int
@@ -25,9 +26,23 @@ class PropProbabilityResponse(BaseModel):
     sample_size: int
     details: dict
 
+class PropBatchRequest(BaseModel):
+    legs: List[PropLeg] = Field(..., min_length=1)
+
+class BatchItemError(BaseModel):
+    index: int
+    error: str
+
+class PropBatchItem(PropProbabilityResponse):
+    index: int
+    leg: PropLeg
+
 class SGPRequest(BaseModel):
     legs: List[PropLeg] = Field(..., min_items=2)
-    n_samples: int = 20000
+    n_samples: int = Field(20000, gt=0)  # draw budget when tol is set
+    sampler: SamplerName = "mc"
+    seed: Optional[int] = None  # fix for reproducible estimates
+    tol: Optional[float] = Field(None, gt=0)  # stop once joint std. error <= tol
 
 class SGPLegResult(BaseModel):
     marginal: float
@@ -38,6 +53,14 @@ class SGPResponse(BaseModel):
     per_leg: List[SGPLegResult]
     kendall_tau: List[List[float]]
     sample_size: int
+    std_error: Optional[float] = None  # Monte Carlo std. error of joint_probability
+    n_draws: int = 0
+
+class SGPBatchRequest(BaseModel):
+    parlays: List[SGPRequest] = Field(..., min_length=1)
+
+class SGPBatchItem(SGPResponse):
+    index: int
 
 class ChatRequest(BaseModel):
     query: str
@@ -45,4 +68,11 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     answer: str
     legs: List[PropLeg]
-    probabilities: Optional[SGPResponse | PropProbabilityResponse] = None
\ No newline at end of file
+    probabilities: Optional[SGPResponse | PropProbabilityResponse] = None
+
+class ChatBatchRequest(BaseModel):
+    queries: List[str] = Field(..., min_length=1)
+
+class ChatBatchItem(ChatResponse):
+    index: int
+    query: str
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""Memory-mapped columnar snapshot of `player_games`, shared across gunicorn workers.
+
+Layout of one snapshot file:
+    MAGIC | uint64 header length | JSON header | 64-byte aligned column arrays
+Rows are sorted by player_id; `player_ids` + `offsets` index each player's slice.
+Ingestion publishes a new version by writing `player_games-<version>.snap` and
+atomically swapping the `CURRENT` pointer file; workers notice the new version
+on their next lookup and remap. Old mappings stay valid until dropped.
+
+The header records the database URL and max(player_games.id) it was built from.
+If either no longer matches (another DB, or rows written without a publish),
+lookups fall back to the DB until a fresh snapshot is published. Deleting rows
+without republishing is not detected.
+"""
+
+from __future__ import annotations
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+
+from .config import settings
+from .db import engine
+from .models import PlayerGame
+from .util_logging import get_logger
+
+log = get_logger(__name__)
+
+MAGIC = b"NBASNAP1"
+STAT_COLUMNS = ["minutes", "pts", "reb", "ast", "stl", "blk", "tov", "fg3m"]
+_ALIGN = 64
+_KEEP_VERSIONS = 2
+_CHECK_INTERVAL = 1.0  # seconds between CURRENT pointer checks per worker
+
+
+class Snapshot:
+    """Read-only view over a snapshot file; arrays are np.memmap slices of one mapping."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a player_games snapshot: {path}")
+            hlen = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+            self.header = json.loads(f.read(hlen))
+        self.version: str = self.header["version"]
+        self.columns: dict[str, np.ndarray] = {}
+        for name, meta in self.header["columns"].items():
+            dtype, shape = np.dtype(meta["dtype"]), tuple(meta["shape"])
+            if 0 in shape:
+                # mmap cannot map zero bytes (empty player_games table)
+                self.columns[name] = np.empty(shape, dtype=dtype)
+                continue
+            self.columns[name] = np.memmap(path, dtype=dtype, mode="r", offset=meta["offset"], shape=shape)
+        self.player_ids = self.columns["player_ids"]
+        self.offsets = self.columns["offsets"]
+
+    def _slice(self, player_id: int) -> slice | None:
+        i = int(np.searchsorted(self.player_ids, player_id))
+        if i >= len(self.player_ids) or self.player_ids[i] != player_id:
+            return None
+        return slice(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def player_frame(self, player_id: int, columns: list[str] | None = None) -> pd.DataFrame:
+        """History rows for one player as a DataFrame (empty with the right columns if unknown)."""
+        cols = columns or STAT_COLUMNS
+        sl = self._slice(player_id)
+        if sl is None:
+            return pd.DataFrame(columns=[*cols, "game_id"])
+        data = {c: np.asarray(self.columns[c][sl]) for c in cols}
+        data["game_id"] = np.char.decode(self.columns["game_id"][sl], "ascii")
+        return pd.DataFrame(data)
+
+
+def _write_snapshot(df: pd.DataFrame, path: Path, version: str, source: dict | None = None) -> None:
+    df = df.sort_values(["player_id", "game_id"], kind="stable")
+    pids, starts = np.unique(df["player_id"].to_numpy(dtype=np.int64), return_index=True)
+    offsets = np.append(starts, len(df)).astype(np.int64)
+    width = max(1, int(df["game_id"].str.len().max() or 1)) if len(df) else 1
+    arrays = {
+        "player_ids": pids,
+        "offsets": offsets,
+        "game_id": df["game_id"].to_numpy(dtype=f"S{width}"),
+    }
+    for c in STAT_COLUMNS:
+        arrays[c] = df[c].to_numpy(dtype=np.float64)
+
+    # Header size depends on offsets, so lay out against a generous fixed header budget
+    meta: dict[str, dict] = {}
+    pos = 0
+    for name, arr in arrays.items():
+        meta[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": pos}
+        pos += -(-arr.nbytes // _ALIGN) * _ALIGN
+    base = -(-(len(MAGIC) + 8 + 4096) // _ALIGN) * _ALIGN
+    for m in meta.values():
+        m["offset"] += base
+    header = json.dumps({
+        "version": version, "n_rows": int(len(df)), "source": source or {}, "columns": meta,
+    }).encode()
+    if len(header) > 4096:
+        raise ValueError("snapshot header too large")
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(np.array([len(header)], dtype="<u8").tobytes())
+        f.write(header)
+        for name, arr in arrays.items():
+            f.seek(meta[name]["offset"])
+            f.write(np.ascontiguousarray(arr).tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def publish_snapshot(snapshot_dir: str | None = None) -> Path | None:
+    """Dump `player_games` to a new snapshot version and point CURRENT at it."""
+    d = snapshot_dir or settings.snapshot_dir
+    if not d:
+        return None
+    root = Path(d)
+    root.mkdir(parents=True, exist_ok=True)
+    stmt = select(PlayerGame.player_id, PlayerGame.game_id, *[getattr(PlayerGame, c) for c in STAT_COLUMNS])
+    with engine.connect() as conn:
+        max_id = conn.execute(select(func.max(PlayerGame.id))).scalar()
+        df = pd.read_sql(stmt, conn)
+
+    version = f"{time.time_ns():x}"
+    final = root / f"player_games-{version}.snap"
+    tmp = final.with_suffix(".tmp")
+    _write_snapshot(df, tmp, version, _source(max_id))
+    os.replace(tmp, final)
+    # Unique temp name: publishes from different workers/tasks may overlap
+    ptr_tmp = root / f"CURRENT.{os.getpid()}.{version}.tmp"
+    ptr_tmp.write_text(final.name)
+    os.replace(ptr_tmp, root / "CURRENT")
+    log.info(f"Published snapshot {final.name} ({len(df)} rows).")
+
+    # Prune old versions; workers still mapping them keep their pages until they remap
+    for old in sorted(root.glob("player_games-*.snap"))[:-_KEEP_VERSIONS]:
+        old.unlink(missing_ok=True)
+    return final
+
+
+def _source(max_id: int | None) -> dict:
+    return {"database_url": str(engine.url), "max_id": max_id}
+
+
+def _matches_db(snap: Snapshot) -> bool:
+    with engine.connect() as conn:
+        max_id = conn.execute(select(func.max(PlayerGame.id))).scalar()
+    return snap.header.get("source") == _source(max_id)
+
+
+_current: Snapshot | None = None
+_usable = False
+_checked_at = 0.0
+_warned: str | None = None
+_lock = threading.Lock()
+
+
+def _warn_once(key: str, msg: str) -> None:
+    global _warned
+    if _warned != key:
+        log.warning(msg)
+        _warned = key
+
+
+def get_snapshot() -> Snapshot | None:
+    """Current snapshot for this worker, or None (use the DB) if none is published
+    or the published one was not built from the current database state."""
+    global _current, _usable, _checked_at
+    if not settings.snapshot_dir:
+        return None
+    now = time.monotonic()
+    if now - _checked_at < _CHECK_INTERVAL:
+        return _current if _usable else None
+    with _lock:
+        _checked_at = now
+        _usable = False
+        root = Path(settings.snapshot_dir)
+        try:
+            name = (root / "CURRENT").read_text().strip()
+        except FileNotFoundError:
+            _current = None
+            return None
+        if _current is None or _current.path.name != name:
+            try:
+                _current = Snapshot(root / name)
+                log.info(f"Mapped snapshot {name} (pid {os.getpid()}).")
+            except (OSError, ValueError) as e:
+                # Never keep serving a version CURRENT no longer names
+                _current = None
+                _warn_once(f"bad:{name}", f"snapshot {name} unavailable, using DB: {e}")
+                return None
+        if not _matches_db(_current):
+            _warn_once(f"stale:{name}", f"snapshot {name} does not match the database, using DB")
+            return None
+        _usable = True
+        return _current
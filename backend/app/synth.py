@@ -0,0 +1,225 @@
+"""Vectorized synthetic box-score generator for scale and load testing.
+
+Builds N players x M seasons of correlated per-game stat lines in NumPy and
+bulk-inserts them with executemany, one transaction per chunk of players. Each player is drawn from an archetype
+(guard / wing / big / bench) with its own mean level; per-game stat lines come
+from a multivariate normal with a shared correlation structure (minutes drive
+volume, points go with threes, rebounds with blocks, assists with turnovers).
+Players are split into teams of ROSTER_SIZE; teammates share game ids.
+Same seed, same database.
+
+CLI (from backend/):
+    python -m app.synth --players 500 --seasons 5 --seed 7
+"""
+
+from __future__ import annotations
+import argparse
+import math
+import time
+from contextlib import closing
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import delete, insert
+
+from .db import engine, Base
+from .models import Player, Game, PlayerGame
+from .util_logging import get_logger
+
+log = get_logger(__name__)
+
+# Synthetic players live in their own id range so regeneration never touches real data
+PLAYER_ID_BASE = 9_000_000
+GAME_PREFIX = "SYN"
+ROSTER_SIZE = 15
+MAX_TEAMS = 9999  # team field of the synthetic game id is 4 digits
+CHUNK_PLAYERS = 250
+
+STATS = ["minutes", "pts", "reb", "ast", "stl", "blk", "tov", "fg3m"]
+
+# Per-game (mean, sd) for each stat in STATS order
+ARCHETYPES: dict[str, tuple[list[float], list[float]]] = {
+    "guard": ([33.0, 21.0, 4.5, 6.5, 1.2, 0.3, 2.8, 2.6], [5.0, 7.0, 2.2, 2.8, 0.9, 0.5, 1.5, 1.7]),
+    "wing":  ([31.0, 17.0, 5.5, 3.0, 1.0, 0.5, 1.8, 2.0], [5.0, 6.5, 2.4, 1.8, 0.8, 0.6, 1.2, 1.5]),
+    "big":   ([28.0, 14.0, 9.5, 2.2, 0.7, 1.4, 1.7, 0.5], [5.0, 5.5, 3.2, 1.6, 0.7, 1.1, 1.2, 0.8]),
+    "bench": ([16.0, 6.5, 3.0, 1.5, 0.5, 0.3, 0.9, 0.8], [6.0, 4.0, 2.0, 1.3, 0.6, 0.5, 0.9, 0.9]),
+}
+ARCHETYPE_WEIGHTS = [0.3, 0.25, 0.2, 0.25]
+
+# Shared correlation between per-game stats (STATS order)
+_CORR = np.array([
+    # min   pts   reb   ast   stl   blk   tov   fg3m
+    [1.00, 0.60, 0.40, 0.40, 0.20, 0.20, 0.30, 0.35],
+    [0.60, 1.00, 0.20, 0.20, 0.10, 0.05, 0.30, 0.60],
+    [0.40, 0.20, 1.00, 0.10, 0.05, 0.30, 0.10, 0.00],
+    [0.40, 0.20, 0.10, 1.00, 0.15, 0.00, 0.40, 0.10],
+    [0.20, 0.10, 0.05, 0.15, 1.00, 0.05, 0.05, 0.05],
+    [0.20, 0.05, 0.30, 0.00, 0.05, 1.00, 0.00, -0.05],
+    [0.30, 0.30, 0.10, 0.40, 0.05, 0.00, 1.00, 0.10],
+    [0.35, 0.60, 0.00, 0.10, 0.05, -0.05, 0.10, 1.00],
+])
+_CHOL = np.linalg.cholesky(_CORR)
+
+
+def n_teams_for(n_players: int) -> int:
+    return max(1, math.ceil(n_players / ROSTER_SIZE))
+
+
+def _game_id(season_idx: int, team: int, game_no: int) -> str:
+    # Teammates share game ids, so synthetic parlays can join across players
+    return f"{GAME_PREFIX}{season_idx:02d}{team:04d}{game_no:03d}"
+
+
+def _executemany_sql(conn, table: str, cols: list[str]) -> str:
+    """Positional INSERT for the DBAPI's paramstyle (rows are passed as tuples)."""
+    style = conn.dialect.paramstyle
+    if style == "qmark":
+        marks = ["?"] * len(cols)
+    elif style in ("format", "pyformat"):
+        marks = ["%s"] * len(cols)
+    elif style == "numeric":
+        marks = [f":{i}" for i in range(1, len(cols) + 1)]
+    else:
+        raise ValueError(f"Unsupported DBAPI paramstyle for bulk insert: {style}")
+    return f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join(marks)})"
+
+
+def generate_player_games(
+    first_player: int,
+    n_players: int,
+    n_seasons: int,
+    games_per_season: int,
+    rng: np.random.Generator,
+    n_teams: int | None = None,
+) -> dict[str, np.ndarray]:
+    """Columnar player_games rows for players [first_player, first_player + n_players).
+    Player p plays for team p % n_teams (default: sized for first_player + n_players players).
+    """
+    n_teams = n_teams or n_teams_for(first_player + n_players)
+    names = list(ARCHETYPES)
+    arche = rng.choice(len(names), size=n_players, p=ARCHETYPE_WEIGHTS)
+    means = np.array([ARCHETYPES[n][0] for n in names])[arche]     # (P, S)
+    sds = np.array([ARCHETYPES[n][1] for n in names])[arche]
+    level = rng.lognormal(0.0, 0.2, size=(n_players, 1))          # player quality
+    means = means * level
+    sds = sds * np.sqrt(level)
+
+    g = n_seasons * games_per_season
+    z = rng.standard_normal(size=(n_players, g, len(STATS))) @ _CHOL.T
+    x = np.clip(means[:, None, :] + sds[:, None, :] * z, 0.0, None).reshape(-1, len(STATS))
+
+    minutes = np.minimum(np.round(x[:, 0], 1), 48.0)
+    counts = np.round(x[:, 1:])
+    pts, reb, ast, stl, blk, tov, fg3m = counts.T
+    fg3m = np.minimum(fg3m, np.floor(pts / 3))
+    ftm = np.minimum(np.round(pts * rng.uniform(0.08, 0.22, size=pts.shape)), pts - 3 * fg3m)
+    # pts = 2*fgm + fg3m + ftm must come out whole: nudge ftm by one when the rest is odd
+    odd = (pts - fg3m - ftm) % 2 == 1
+    ftm = ftm + np.where(odd, np.where(ftm > 0, -1, 1), 0)
+    fgm = (pts - ftm - fg3m) / 2
+    fga = np.maximum(np.round(fgm / rng.uniform(0.38, 0.56, size=pts.shape)), fgm)
+    fg3a = np.maximum(np.round(fg3m / rng.uniform(0.28, 0.42, size=pts.shape)), fg3m)
+    fta = np.maximum(np.round(ftm / rng.uniform(0.65, 0.9, size=pts.shape)), ftm)
+
+    pid_local = np.repeat(np.arange(n_players), g)
+    game_in_career = np.tile(np.arange(g), n_players)
+    player_ids = PLAYER_ID_BASE + first_player + pid_local
+    team = (first_player + pid_local) % n_teams
+    season_idx = game_in_career // games_per_season
+    code = (season_idx * n_teams + team) * games_per_season + game_in_career % games_per_season
+    # Format each distinct game id in this chunk once, then gather
+    uniq, inverse = np.unique(code, return_inverse=True)
+    ids = np.array([_game_id(*divmod(int(c) // games_per_season, n_teams), int(c) % games_per_season)
+                    for c in uniq], dtype=object)[inverse]
+
+    # Rows ordered by (game_id, player_id) so the game_id-led indexes fill sequentially
+    order = np.lexsort((player_ids, code))
+    cols = {
+        "game_id": ids, "player_id": player_ids, "minutes": minutes,
+        "pts": pts, "reb": reb, "ast": ast, "stl": stl, "blk": blk, "tov": tov,
+        "fgm": fgm, "fga": fga, "fg3m": fg3m, "fg3a": fg3a, "ftm": ftm, "fta": fta,
+    }
+    cols = {k: v[order] for k, v in cols.items()}
+    cols["archetype"] = np.array(names)[arche]  # per player, not per row
+    return cols
+
+
+def seed_synthetic(
+    n_players: int,
+    n_seasons: int,
+    *,
+    games_per_season: int = 82,
+    seed: int = 7,
+    first_season: int = 2015,
+) -> dict:
+    """Replace all synthetic rows with a fresh N x M dataset; returns row counts and throughput."""
+    if min(n_players, n_seasons, games_per_season) <= 0:
+        raise ValueError("players, seasons and games_per_season must be positive")
+    if games_per_season > 999:
+        raise ValueError("games_per_season must be <= 999")
+    n_teams = n_teams_for(n_players)
+    if n_teams > MAX_TEAMS:
+        raise ValueError(f"players must be <= {MAX_TEAMS * ROSTER_SIZE}")
+    rng = np.random.default_rng(seed)
+    Base.metadata.create_all(bind=engine)
+    t0 = time.perf_counter()
+    pg_cols = [c.name for c in PlayerGame.__table__.columns if c.name != "id"]
+
+    # Clear old rows and lay out the schedule first, then commit each chunk on its own so a
+    # large seed never holds one giant transaction (a failure leaves the finished chunks)
+    with engine.begin() as conn:
+        conn.execute(delete(PlayerGame).where(PlayerGame.player_id >= PLAYER_ID_BASE))
+        conn.execute(delete(Player).where(Player.id >= PLAYER_ID_BASE))
+        conn.execute(delete(Game).where(Game.id.like(f"{GAME_PREFIX}%")))
+        n_games = 0
+        for s in range(n_seasons):
+            opening = date(first_season + s, 10, 22)
+            games = [
+                {"id": _game_id(s, t, gno), "game_date": opening + timedelta(days=2 * gno),
+                 "home_team": f"T{t:02d}", "away_team": "OPP"}
+                for t in range(n_teams) for gno in range(games_per_season)
+            ]
+            conn.execute(insert(Game.__table__), games)
+            n_games += len(games)
+
+    rows = 0
+    for first in range(0, n_players, CHUNK_PLAYERS):
+        n = min(CHUNK_PLAYERS, n_players - first)
+        cols = generate_player_games(first, n, n_seasons, games_per_season, rng, n_teams)
+        arche = cols["archetype"]
+        with engine.begin() as conn, closing(conn.connection.cursor()) as cur:
+            conn.execute(insert(Player.__table__), [
+                {"id": PLAYER_ID_BASE + first + i, "full_name": f"Synthetic {arche[i].title()} {first + i}",
+                 "team_abbrev": f"T{(first + i) % n_teams:02d}"}
+                for i in range(n)
+            ])
+            # DBAPI executemany straight from column arrays; tolist() gives plain Python scalars
+            pg_insert = _executemany_sql(conn, PlayerGame.__tablename__, pg_cols)
+            cur.executemany(pg_insert, list(zip(*(cols[c].tolist() for c in pg_cols), strict=True)))
+        rows += len(cols["player_id"])
+
+    elapsed = time.perf_counter() - t0
+    log.info(f"Seeded {rows} synthetic player_games in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s).")
+    return {
+        "players": n_players, "seasons": n_seasons, "games": n_games,
+        "player_games": rows, "seconds": round(elapsed, 2), "rows_per_sec": int(rows / elapsed),
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Bulk-generate synthetic player_games.")
+    ap.add_argument("--players", type=int, default=500)
+    ap.add_argument("--seasons", type=int, default=5)
+    ap.add_argument("--games", type=int, default=82, help="games per season")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--no-snapshot", action="store_true", help="skip publishing the history snapshot")
+    args = ap.parse_args()
+
+    print(seed_synthetic(args.players, args.seasons, games_per_season=args.games, seed=args.seed))
+    if not args.no_snapshot:
+        from .snapshot import publish_snapshot
+        publish_snapshot()
+
+
+if __name__ == "__main__":
+    main()
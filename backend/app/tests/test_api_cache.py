@@ -0,0 +1,72 @@
+import os
+import time
+from datetime import date
+
+import pytest
+from app import api_cache
+from app.config import settings
+
+RAW = {"resultSets": [{"name": "PlayerGameLog", "headers": ["GAME_ID", "PTS"], "rowSet": [["0022300001", 31]]}]}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "nba_api_cache_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "nba_api_offline", False)
+    monkeypatch.setattr(settings, "nba_api_cache_ttl", 60)
+    return tmp_path
+
+
+def _set_fetched_at(cache_dir, ts):
+    for p in cache_dir.rglob("*.json.gz"):
+        entry = api_cache._read(p)
+        entry["fetched_at"] = ts
+        api_cache._write(p, entry)
+
+
+def test_season_is_complete():
+    assert api_cache.season_is_complete("2023-24", today=date(2024, 7, 1))
+    assert not api_cache.season_is_complete("2024-25", today=date(2025, 3, 1))
+
+
+def test_replay_and_ttl(cache_dir):
+    calls = []
+    fetch = lambda: calls.append(1) or RAW  # noqa: E731
+
+    raw, cached = api_cache.get_or_fetch("PlayerGameLog", 1, "2019-20", "Regular Season", fetch)
+    assert not cached and raw == RAW
+    raw, cached = api_cache.get_or_fetch("PlayerGameLog", 1, "2019-20", "Regular Season", fetch)
+    assert cached and raw == RAW and len(calls) == 1
+    assert api_cache.first_frame(raw)["PTS"].tolist() == [31]
+
+    # Current-season entries expire; completed seasons never do
+    current = f"{date.today().year}-{(date.today().year + 1) % 100:02d}"
+    api_cache.get_or_fetch("PlayerGameLog", 1, current, "Regular Season", fetch)
+    _set_fetched_at(cache_dir, time.time() - 3600)
+    api_cache.get_or_fetch("PlayerGameLog", 1, current, "Regular Season", fetch)
+    api_cache.get_or_fetch("PlayerGameLog", 1, "2019-20", "Regular Season", fetch)
+    assert len(calls) == 3
+
+
+def test_offline_miss_raises(cache_dir, monkeypatch):
+    monkeypatch.setattr(settings, "nba_api_offline", True)
+    with pytest.raises(api_cache.OfflineCacheMiss):
+        api_cache.get_or_fetch("PlayerGameLog", 2, "2019-20", "Regular Season", lambda: RAW)
+
+
+def test_entry_written_mid_season_expires_after_season_end(cache_dir):
+    calls = []
+    fetch = lambda: calls.append(1) or RAW  # noqa: E731
+
+    api_cache.get_or_fetch("PlayerGameLog", 3, "2019-20", "Regular Season", fetch)
+    # Pretend it was cached in April 2020, before the season ended
+    _set_fetched_at(cache_dir, time.mktime(date(2020, 4, 15).timetuple()))
+    # A copy (cp -r, docker COPY) resets mtime; that must not make the entry look fresh
+    for p in cache_dir.rglob("*.json.gz"):
+        os.utime(p)
+
+    _, cached = api_cache.get_or_fetch("PlayerGameLog", 3, "2019-20", "Regular Season", fetch)
+    assert not cached and len(calls) == 2
+    # The refetched copy was written after the season ended, so it is now permanent
+    _, cached = api_cache.get_or_fetch("PlayerGameLog", 3, "2019-20", "Regular Season", fetch)
+    assert cached and len(calls) == 2
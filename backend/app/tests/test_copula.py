@@ -1,6 +1,7 @@
+import pytest
 import numpy as np
 import pandas as pd
-from app.copula import gaussian_copula_joint_overprob
+from app.copula import gaussian_copula_joint_estimate, gaussian_copula_joint_overprob
 
 
 def test_copula_shapes():
@@ -17,4 +18,69 @@ def test_copula_shapes():
     joint, marginals, taus = gaussian_copula_joint_overprob(df, legs, n_samples=5000)
     assert 0.0 <= joint <= 1.0
     assert len(marginals) == 3
-    assert len(taus) == 3 and len(taus[0]) == 3
\ No newline at end of file
+    assert len(taus) == 3 and len(taus[0]) == 3
+
+def _correlated_df(n=300):
+    rng = np.random.default_rng(0)
+    C = np.array([[1.0, 0.5, 0.3], [0.5, 1.0, 0.2], [0.3, 0.2, 1.0]])
+    Z = rng.multivariate_normal(np.zeros(3), C, size=n)
+    return pd.DataFrame({
+        "pts": np.round(25 + 6 * Z[:, 0]),
+        "reb": np.round(8 + 3 * Z[:, 1]),
+        "ast": np.round(6 + 2 * Z[:, 2]),
+    })
+
+
+LEGS = [
+    {"player_id": 1, "prop": "pts", "threshold": 25, "op": ">="},
+    {"player_id": 1, "prop": "reb", "threshold": 8, "op": ">="},
+    {"player_id": 1, "prop": "ast", "threshold": 6, "op": ">="},
+]
+
+
+def test_seeded_samplers_reproducible():
+    df = _correlated_df()
+    for sampler in ("mc", "antithetic", "sobol"):
+        a = gaussian_copula_joint_estimate(df, LEGS, 4096, sampler=sampler, seed=11)
+        b = gaussian_copula_joint_estimate(df, LEGS, 4096, sampler=sampler, seed=11)
+        assert a[0] == b[0] and a[3] == b[3] and a[4] == b[4]
+
+
+def test_samplers_agree():
+    df = _correlated_df()
+    ref = gaussian_copula_joint_estimate(df, LEGS, 100000, sampler="mc", seed=3)[0]
+    for sampler in ("antithetic", "sobol"):
+        joint, _, _, se, n = gaussian_copula_joint_estimate(df, LEGS, 20000, sampler=sampler, seed=3)
+        assert abs(joint - ref) < 0.02
+        assert se is not None and se > 0 and n > 0
+
+
+def test_sobol_adaptive_stopping():
+    df = _correlated_df()
+    joint, _, _, se, n = gaussian_copula_joint_estimate(
+        df, LEGS, 20000, sampler="sobol", seed=5, tol=0.003
+    )
+    assert se <= 0.003
+    assert n < 20000
+
+
+def test_sobol_respects_small_budget():
+    df = _correlated_df()
+    for budget in (16, 100, 1000):
+        _, _, _, _, n = gaussian_copula_joint_estimate(df, LEGS, budget, sampler="sobol", seed=1)
+        assert 0 < n <= budget
+    with pytest.raises(ValueError):
+        gaussian_copula_joint_estimate(df, LEGS, 8, sampler="sobol", seed=1)
+
+
+def test_adaptive_std_error_coverage():
+    # The reported std_error is what clients see as the achieved error: +-2 se should
+    # cover the reference about 95% of the time even with adaptive stopping
+    df = _correlated_df()
+    ref = np.mean([gaussian_copula_joint_estimate(df, LEGS, 262144, sampler="sobol", seed=1000 + k)[0]
+                   for k in range(4)])
+    misses = 0
+    for k in range(100):
+        joint, _, _, se, _ = gaussian_copula_joint_estimate(df, LEGS, 20000, sampler="sobol", seed=k, tol=0.003)
+        misses += abs(joint - ref) > 2 * se
+    assert misses <= 10
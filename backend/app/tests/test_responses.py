@@ -0,0 +1,122 @@
+import numpy as np
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.responses import NDJSONResponse, NDJSON_MEDIA_TYPE, ORJSONResponse
+from app.schemas import PropLeg
+
+
+def test_orjson_and_ndjson_stream():
+    app = FastAPI()
+    leg = PropLeg(player_id=1, prop="pts", threshold=25)
+
+    @app.get("/one", response_class=ORJSONResponse)
+    def one():
+        return {"leg": leg, "p": np.float64(0.25)}
+
+    @app.get("/many")
+    def many():
+        return NDJSONResponse({"index": i, "p": np.float64(i / 4)} for i in range(3))
+
+    client = TestClient(app)
+    body = client.get("/one").json()
+    assert body == {"leg": {"player_id": 1, "prop": "pts", "threshold": 25.0, "op": ">=", "date": None}, "p": 0.25}
+
+    r = client.get("/many")
+    assert r.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+    lines = [orjson.loads(l) for l in r.content.splitlines()]
+    assert [row["index"] for row in lines] == [0, 1, 2]
+    assert lines[2]["p"] == 0.5
+
+
+def _batch_client(monkeypatch):
+    import pandas as pd
+    from app import nlp, props, router_chat, router_props
+
+    rng = np.random.default_rng(0)
+    hist = pd.DataFrame({
+        "pts": rng.poisson(25, 60).astype(float), "reb": rng.poisson(8, 60).astype(float),
+        "ast": rng.poisson(6, 60).astype(float), "game_id": [f"G{i}" for i in range(60)],
+    })
+
+    # Player 1 has history, everyone else has none (independence fallback path)
+    def fake_history(player_id, cutoff=None):
+        return hist if player_id == 1 else props._empty_hist()
+
+    def fake_joint(legs, cutoff=None):
+        if any(leg["player_id"] != 1 for leg in legs):
+            return pd.DataFrame()
+        return hist[["game_id", *{leg["prop"] for leg in legs}]]
+
+    def fake_parse(query):
+        if "pts" not in query:
+            return [], "nothing parsed"
+        return [PropLeg(player_id=1, prop="pts", threshold=25)], "parsed"
+
+    monkeypatch.setattr(props, "_get_player_history", fake_history)
+    monkeypatch.setattr(props, "build_joint_dataset", fake_joint)
+    monkeypatch.setattr(nlp, "parse_query", fake_parse)
+
+    app = FastAPI()
+    app.include_router(router_props.router)
+    app.include_router(router_chat.router)
+    return TestClient(app)
+
+
+def _both(client, url, body):
+    buffered = client.post(url, json=body)
+    assert buffered.status_code == 200
+    streamed = client.post(url, params={"stream": "true"}, json=body)
+    assert streamed.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+    return buffered.json(), [orjson.loads(l) for l in streamed.content.splitlines()]
+
+
+def test_batch_routes_stream_matches_buffered(monkeypatch):
+    client = _batch_client(monkeypatch)
+    leg = {"player_id": 1, "prop": "pts", "threshold": 25}
+    cases = [
+        ("/props/probability/batch", {"legs": [leg, {**leg, "player_id": 2}, {**leg, "threshold": 30}]}),
+        ("/props/sgp/batch", {"parlays": [
+            {"legs": [leg, {**leg, "prop": "reb", "threshold": 8}], "seed": 1},
+            {"legs": [leg, {**leg, "player_id": 2}]},  # no joint history
+        ]}),
+        ("/chat/ask/batch", {"queries": ["Tatum 25+ pts", "hello"]}),
+    ]
+    for url, body in cases:
+        buffered, streamed = _both(client, url, body)
+        n = len(next(iter(body.values())))
+        assert len(buffered) == len(streamed) == n
+        assert [r["index"] for r in streamed] == list(range(n))
+        for b, s in zip(buffered, streamed):
+            assert set(b) == set(s)
+            assert b["index"] == s["index"]
+            if isinstance(b.get("probabilities"), dict):
+                assert set(b["probabilities"]) == set(s["probabilities"])
+
+
+def _ok_and_bad_parlays():
+    leg = {"player_id": 1, "prop": "pts", "threshold": 25}
+    ok = {"legs": [leg, {**leg, "prop": "reb", "threshold": 8}], "seed": 1}
+    bad = {**ok, "sampler": "sobol", "n_samples": 4}  # below the sobol minimum
+    return [ok, bad, ok]
+
+
+def test_stream_reports_item_errors(monkeypatch):
+    client = _batch_client(monkeypatch)
+    r = client.post("/props/sgp/batch", params={"stream": "true"}, json={"parlays": _ok_and_bad_parlays()})
+    lines = [orjson.loads(l) for l in r.content.splitlines()]
+    assert [l["index"] for l in lines] == [0, 1, 2]
+    assert "error" in lines[1] and "n_samples" in lines[1]["error"]
+    assert "joint_probability" in lines[2]
+
+
+def test_buffered_reports_item_errors(monkeypatch):
+    client = _batch_client(monkeypatch)
+    r = client.post("/props/sgp/batch", json={"parlays": _ok_and_bad_parlays()})
+    assert r.status_code == 200
+    rows = r.json()
+    assert [row["index"] for row in rows] == [0, 1, 2]
+    assert "error" in rows[1] and "n_samples" in rows[1]["error"]
+    assert "joint_probability" in rows[0] and "joint_probability" in rows[2]
+    streamed = client.post("/props/sgp/batch", params={"stream": "true"}, json={"parlays": _ok_and_bad_parlays()})
+    assert rows == [orjson.loads(l) for l in streamed.content.splitlines()]
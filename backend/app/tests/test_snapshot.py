@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+from app.snapshot import Snapshot, STAT_COLUMNS, _write_snapshot
+
+
+def test_snapshot_roundtrip(tmp_path):
+    rng = np.random.default_rng(0)
+    rows = []
+    for pid in (203999, 1628369, 201939):
+        for g in range(5):
+            rows.append({"player_id": pid, "game_id": f"00223{pid % 1000:03d}{g:02d}",
+                         **{c: float(rng.integers(0, 40)) for c in STAT_COLUMNS}})
+    df = pd.DataFrame(rows)
+    path = tmp_path / "player_games-1.snap"
+    _write_snapshot(df, path, "1")
+
+    snap = Snapshot(path)
+    assert snap.version == "1"
+    assert list(snap.player_ids) == sorted({r["player_id"] for r in rows})
+    got = snap.player_frame(1628369)
+    want = df[df["player_id"] == 1628369].sort_values("game_id")
+    assert got["game_id"].tolist() == want["game_id"].tolist()
+    assert np.allclose(got["pts"].to_numpy(), want["pts"].to_numpy())
+    assert snap.player_frame(1).empty
+
+
+def _published_db(tmp_path, monkeypatch):
+    from sqlalchemy import create_engine, insert
+    from app import snapshot
+    from app.config import settings
+    from app.db import Base
+    from app.models import PlayerGame
+
+    eng = create_engine(f"sqlite:///{tmp_path / 'pg.db'}")
+    Base.metadata.create_all(eng)
+    monkeypatch.setattr(snapshot, "engine", eng)
+    monkeypatch.setattr(settings, "snapshot_dir", str(tmp_path / "snap"))
+    monkeypatch.setattr(snapshot, "_CHECK_INTERVAL", 0.0)
+    monkeypatch.setattr(snapshot, "_current", None)
+    monkeypatch.setattr(snapshot, "_usable", False)
+    monkeypatch.setattr(snapshot, "_checked_at", 0.0)
+
+    def add_game(gid):
+        with eng.begin() as conn:
+            conn.execute(insert(PlayerGame.__table__), [{
+                "game_id": gid, "player_id": 7, "fgm": 0, "fga": 0, "fg3a": 0, "ftm": 0, "fta": 0,
+                **{c: 1.0 for c in STAT_COLUMNS},
+            }])
+
+    return eng, add_game
+
+
+def test_publish_switches_worker_version(tmp_path, monkeypatch):
+    from app import snapshot
+
+    _, add_game = _published_db(tmp_path, monkeypatch)
+    add_game("G1")
+    first = snapshot.publish_snapshot()
+    snap1 = snapshot.get_snapshot()
+    assert snap1.path == first and len(snap1.player_frame(7)) == 1
+
+    add_game("G2")
+    second = snapshot.publish_snapshot()
+    snap2 = snapshot.get_snapshot()
+    assert snap2.path == second and snap2.version != snap1.version
+    assert snap2.player_frame(7)["game_id"].tolist() == ["G1", "G2"]
+    assert not list((tmp_path / "snap").glob("*.tmp"))
+
+
+def test_publish_empty_table_replaces_old_rows(tmp_path, monkeypatch):
+    from sqlalchemy import delete
+    from app import snapshot
+    from app.models import PlayerGame
+
+    eng, add_game = _published_db(tmp_path, monkeypatch)
+    add_game("G1")
+    snapshot.publish_snapshot()
+    assert len(snapshot.get_snapshot().player_frame(7)) == 1
+
+    with eng.begin() as conn:
+        conn.execute(delete(PlayerGame))
+    path = snapshot.publish_snapshot()
+    snap = snapshot.get_snapshot()
+    assert snap.path == path and len(snap.player_ids) == 0
+    assert snap.player_frame(7).empty
+
+
+def test_stale_snapshot_falls_back_to_db(tmp_path, monkeypatch):
+    from app import snapshot
+
+    _, add_game = _published_db(tmp_path, monkeypatch)
+    add_game("G1")
+    snapshot.publish_snapshot()
+    assert snapshot.get_snapshot() is not None
+
+    add_game("G2")  # written without publishing
+    assert snapshot.get_snapshot() is None
+    snapshot.publish_snapshot()
+    assert snapshot.get_snapshot().player_frame(7)["game_id"].tolist() == ["G1", "G2"]
+
+
+def test_snapshot_columns_are_aligned(tmp_path):
+    df = pd.DataFrame([{"player_id": 1, "game_id": "G1", **{c: 1.0 for c in STAT_COLUMNS}}])
+    path = tmp_path / "player_games-1.snap"
+    _write_snapshot(df, path, "1")
+    assert all(m["offset"] % 64 == 0 for m in Snapshot(path).header["columns"].values())
+
+
+def test_publish_disabled_with_empty_dir(tmp_path, monkeypatch):
+    from app import snapshot
+    from app.config import settings
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "snapshot_dir", "")
+    assert snapshot.publish_snapshot() is None
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,46 @@
+import numpy as np
+from app.synth import generate_player_games
+
+
+def test_generator_deterministic_and_consistent():
+    a = generate_player_games(0, 40, 2, 82, np.random.default_rng(3))
+    b = generate_player_games(0, 40, 2, 82, np.random.default_rng(3))
+    assert len(a["pts"]) == 40 * 2 * 82
+    assert all(np.array_equal(a[k], b[k]) for k in a)
+
+    # Box-score identities hold row by row
+    assert np.all(a["pts"] == 2 * a["fgm"] + a["fg3m"] + a["ftm"])
+    assert np.all(a["fgm"] <= a["fga"]) and np.all(a["fg3m"] <= a["fg3a"]) and np.all(a["ftm"] <= a["fta"])
+    # Unique (game_id, player_id) and correlated volume stats
+    assert len(set(zip(a["game_id"], a["player_id"]))) == len(a["pts"])
+    assert np.corrcoef(a["minutes"], a["pts"])[0, 1] > 0.3
+    # Rosters are sized from the player count: at most ROSTER_SIZE players per game
+    _, per_game = np.unique(a["game_id"], return_counts=True)
+    assert per_game.max() <= 15
+
+
+def test_seed_synthetic_reseeds_identically(tmp_path, monkeypatch):
+    from sqlalchemy import create_engine, text
+    from app import synth
+
+    eng = create_engine(f"sqlite:///{tmp_path / 'synth.db'}")
+    monkeypatch.setattr(synth, "engine", eng)
+
+    def snapshot():
+        with eng.connect() as conn:
+            counts = [conn.execute(text(f"SELECT COUNT(*) FROM {t}")).scalar()
+                      for t in ("players", "games", "player_games")]
+            rows = conn.execute(text(
+                "SELECT game_id, player_id, pts, reb, ast, fg3m FROM player_games ORDER BY game_id, player_id"
+            )).all()
+        return counts, hash(tuple(rows))
+
+    synth.seed_synthetic(45, 3, games_per_season=10, seed=11)  # different data first
+    first = synth.seed_synthetic(35, 2, games_per_season=10, seed=3)
+    a = snapshot()
+    synth.seed_synthetic(35, 2, games_per_season=10, seed=3)
+    b = snapshot()
+
+    assert first["player_games"] == 35 * 2 * 10
+    assert a[0] == [35, 2 * 3 * 10, 35 * 2 * 10]  # 3 teams of <= 15
+    assert a == b
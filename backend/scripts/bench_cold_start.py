@@ -0,0 +1,82 @@
+"""Cold-start benchmark: `import app.main` time and time-to-first-response.
+
+Usage (from backend/):
+    python scripts/bench_cold_start.py [--runs 5] [--gunicorn]
+
+Each run starts a fresh server process and measures wall time from spawn until
+the first successful `/` response (ready), then the latency of the first
+`/players/search` request (which used to load the player index lazily). With
+--gunicorn the server is started from uvicorn.ini (preload_app), otherwise as
+a single uvicorn worker.
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_time() -> float:
+    code = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=BACKEND, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _first_response(use_gunicorn: bool) -> tuple[float, float]:
+    port = _free_port()
+    if use_gunicorn:
+        cmd = [sys.executable, "-m", "gunicorn", "-c", "uvicorn.ini", "-b", f"127.0.0.1:{port}", "app.main:app"]
+    else:
+        cmd = [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"]
+    base = f"http://127.0.0.1:{port}"
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=BACKEND, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            try:
+                r = httpx.get(base + "/", timeout=30)
+                if r.status_code == 200:
+                    ready = time.perf_counter() - t0
+                    t1 = time.perf_counter()
+                    httpx.get(base + "/players/search", params={"q": "curry"}, timeout=30).raise_for_status()
+                    return ready, time.perf_counter() - t1
+            except httpx.TransportError:
+                pass
+            if proc.poll() is not None:
+                raise RuntimeError("server exited before responding")
+            time.sleep(0.02)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--gunicorn", action="store_true")
+    args = ap.parse_args()
+
+    imports = [_import_time() for _ in range(args.runs)]
+    firsts = [_first_response(args.gunicorn) for _ in range(args.runs)]
+    print(f"import app.main       median {statistics.median(imports):.3f}s  (runs={args.runs})")
+    print(f"spawn -> ready        median {statistics.median(r for r, _ in firsts):.3f}s")
+    print(f"first search latency  median {statistics.median(s for _, s in firsts):.3f}s")
+    print(f"spawn -> first search median {statistics.median(r + s for r, s in firsts):.3f}s")
+
+
+if __name__ == "__main__":
+    main()